@@ -1,96 +1,258 @@
 from __future__ import annotations
-from collections import UserDict
-from collections.abc import Sequence
-from typing import ClassVar, TypeAlias, Generic, TypeVar, Any
+import math
+from collections.abc import Iterator, Sequence
+from typing import ClassVar, Generic, TypeVar
+
+import numpy as np
 
 from beyond.dimension import Dimension
 
 T = TypeVar("T", str, int)
 ShapeType = tuple[Dimension, ...]
 InsightResolverT = dict[T, T | tuple[T, ...]]
-BoardStateVT: TypeAlias = "BoardAxis | Any"
 
 
-class BoardState(UserDict[tuple[T, ...], BoardStateVT]):
+def _compute_strides(sizes: tuple[int, ...]) -> tuple[int, ...]:
+    strides = []
+    stride = 1
+    for size in reversed(sizes):
+        strides.append(stride)
+        stride *= size
+    return tuple(reversed(strides))
+
+
+def _validate_key_ndim(
+    key: T | tuple[T, ...],
+    dims: ShapeType,
+    ndim_self: int,
+    sizes: tuple[int, ...],
+    strides: tuple[int, ...],
+    verb: str = "access",
+    allow_insights: bool = True,
+) -> tuple[tuple[int, ...], int, int]:
+    if not isinstance(key, tuple):
+        key = (key,)
+    ndim = len(key)
+    if ndim > ndim_self:
+        expected_shape = ", ".join("?" * ndim_self).join("()")
+        raise IndexError(
+            f"Cannot {verb} a {ndim}-dimensional board entity "
+            f"in a {ndim_self}-dimensional board (got key: {key}; expected a key like: {expected_shape})"
+        )
+    if not allow_insights:
+        if ndim < ndim_self:
+            expected_shape = ", ".join("?" * ndim_self).join("()")
+            raise NotImplementedError(
+                f"Cannot {verb} a {ndim}-dimensional board entity "
+                f"in a {ndim_self}-dimensional board (got key: {key}; expected a key like: {expected_shape})"
+            )
+    indices = []
+    flat = 0
+    for i in range(ndim):
+        size = sizes[i]
+        index = dims[i].get_axis_index(key[i])
+        if index.__class__ is not int:
+            # e.g. a bool, which NumPy would read as a mask
+            index = int(index)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(
+                f"axe index {index} is out of bounds: "
+                f"dimension {dims[i].name!r} has only {size} axes"
+            )
+        indices.append(index)
+        flat += index * strides[i]
+    return tuple(indices), ndim, flat
+
+
+class BoardState(Generic[T]):
+    __slots__ = (
+        "dims", "_sizes", "_ndim", "_strides", "_cells", "_grid", "_axis_cache",
+    )
+
     dims: ShapeType
+    _cells: np.ndarray
+    _grid: np.ndarray
 
     def __init__(self, shape: ShapeType):
-        super().__init__()
+        cells = np.empty(math.prod(dim.size for dim in shape), dtype=object)
+        self.__setstate__((shape, cells))
+
+    def __getstate__(self) -> tuple[ShapeType, np.ndarray]:
+        return self.dims, self._cells
+
+    def __setstate__(self, state: tuple[ShapeType, np.ndarray]) -> None:
+        # The grid view and cached axes are derived from the cell store,
+        # a copied board must rebuild them instead of copying them apart
+        shape, cells = state
         self.dims = shape
+        self._sizes = tuple(dim.size for dim in shape)
+        self._ndim = len(shape)
+        self._strides = _compute_strides(self._sizes)
+        self._cells = cells
+        self._grid = cells.reshape(self._sizes)
+        self._axis_cache: dict[int, BoardAxis[T]] = {}
 
     @property
     def ndim(self) -> int:
-        return len(self.dims)
+        return self._ndim
 
-    def _validate_key_ndim(
-        self,
-        *,
-        key: T | tuple[T, ...],
-        verb: str = "access",
-        allow_insights: bool = True
-    ) -> tuple[tuple[T, ...], int]:
-        if not isinstance(key, tuple):
-            key = (key,)
-        ndim = len(key)
-        expected_shape = ", ".join("?" * self.ndim).join("()")
-        if ndim > self.ndim:
+    def __setitem__(self, key: T | tuple[T, ...], value):
+        key, ndim, flat = _validate_key_ndim(
+            key, self.dims, self._ndim, self._sizes, self._strides, "set"
+        )
+        if ndim == self._ndim:
+            self._cells[flat] = value
+        else:
+            self._set_axis(key, ndim, flat, value)
+
+    def bulk_set(self, prefix: T | tuple[T, ...], values: Sequence) -> None:
+        key, ndim, flat = _validate_key_ndim(
+            prefix, self.dims, self._ndim, self._sizes, self._strides, "set"
+        )
+        if ndim == self._ndim:
             raise IndexError(
-                f"Cannot {verb} a {ndim}-dimensional board entity "
-                f"in a {self.ndim}-dimensional board (got key: {key}; expected a key like: {expected_shape})"
+                "Cannot bulk-set a single cell "
+                f"in a {self._ndim}-dimensional board (got key: {key})"
             )
-        if not allow_insights:
-            if ndim < self.ndim:
-                raise NotImplementedError(
-                    f"Cannot {verb} a {ndim}-dimensional board entity "
-                    f"in a {self.ndim}-dimensional board (got key: {key}; expected a key like: {expected_shape})"
-                )
-        indices = []
-        for size in range(ndim):
-            dim = self.dims[size]
-            index = dim.get_axis_index(key[size])
-            if index < 0:
-                index += dim.size
-            if index >= dim.size:
-                raise IndexError(
-                    f"axe index {index} is out of bounds: "
-                    f"dimension {dim.name!r} has only {dim.size} axes"
-                )
-            indices.append(index)
-        return tuple(indices), ndim
+        self._set_axis(key, ndim, flat, values)
 
-    def __setitem__(self, key: T | tuple[T, ...], value):
-        key, ndim = self._validate_key_ndim(key=key, verb="set")
-        if ndim == self.ndim:
-            self.data[key] = value
+    def _set_axis(
+        self,
+        key: tuple[int, ...],
+        ndim: int,
+        flat: int,
+        value,
+    ) -> None:
+        dim = self.dims[ndim]
+        value_type = type(value)
+        if (
+            value_type is not list
+            and value_type is not tuple
+            and not isinstance(value, Sequence)
+        ):
+            # The whole sub-board behind the key gets the same value
+            self._grid[key].fill(value)
+            return
+        if len(value) != dim.size:
+            raise ValueError(
+                f"Cannot set {ndim}-dimensional board entity "
+                f"with a value of size {len(value)} "
+                f"in a {self.ndim}-dimensional board "
+                f"with axes of length {dim.size}"
+                f"(raised for key: {key})"
+            )
+        if ndim + 1 == self._ndim:
+            # Keys are already validated and the last axis is contiguous
+            cells = self._cells
+            for i, item in enumerate(value):
+                cells[flat + i] = item
         else:
-            path = key[:ndim]
-            dim = self.dims[ndim]
-            if not isinstance(value, Sequence):
-                value = [value] * dim.size
-            if len(value) != dim.size:
-                raise ValueError(
-                    f"Cannot set {ndim}-dimensional board entity "
-                    f"with a value of size {len(value)} "
-                    f"in a {self.ndim}-dimensional board "
-                    f"with axes of length {dim.size}"
-                    f"(raised for key: {key})"
-                )
-            for i in range(dim.size):
-                self[(*path, i)] = value[i]
+            stride = self._strides[ndim]
+            for i, item in enumerate(value):
+                self._set_axis(key + (i,), ndim + 1, flat + i * stride, item)
 
     def __getitem__(self, key: T | tuple[T, ...]):
-        key, ndim = self._validate_key_ndim(key=key)
-        if ndim == self.ndim:
-            return self.data[key]
+        key, ndim, flat = _validate_key_ndim(
+            key, self.dims, self._ndim, self._sizes, self._strides
+        )
+        if ndim == self._ndim:
+            return self._cells[flat]
         else:
-            return BoardAxis(
-                state=self,
-                path=key[:ndim],
-                dim=self.dims[ndim],
-            )
+            # Axes are views over the cell store, so they never go stale.
+            # A prefix is identified by its flat offset and length,
+            # packed into one int so that the lookup skips tuple hashing
+            cache_key = flat * self._ndim + ndim
+            axis = self._axis_cache.get(cache_key)
+            if axis is None:
+                axis = self._axis_cache[cache_key] = BoardAxis(
+                    state=self,
+                    path=key,
+                    dim=self.dims[ndim],
+                )
+            return axis
+
+    def as_array(self) -> np.ndarray:
+        return self._grid
+
+    def __str__(self):
+        return str(self._grid)
+
+
+_SPECIALIZED_TEMPLATE = """\
+def __getitem__(self, key):
+    if key.__class__ is tuple and len(key) == {ndim}:
+        {unpack} = key
+        if {checks}:
+            return self._cells[{flat}]
+    return _getitem(self, key)
+
+def __setitem__(self, key, value):
+    if key.__class__ is tuple and len(key) == {ndim}:
+        {unpack} = key
+        if {checks}:
+            self._cells[{flat}] = value
+            return
+    _setitem(self, key, value)
+"""
+
+_specialized_states: dict[tuple[int, ...], type[BoardState]] = {}
+
+
+def _specialize(sizes: tuple[int, ...]) -> type[BoardState]:
+    if not sizes:
+        return BoardState
+    state_cls = _specialized_states.get(sizes)
+    if state_cls is not None:
+        return state_cls
+    strides = _compute_strides(sizes)
+    names = [f"i{i}" for i in range(len(sizes))]
+    source = _SPECIALIZED_TEMPLATE.format(
+        ndim=len(sizes),
+        unpack=", ".join(names) + ("," if len(names) == 1 else ""),
+        checks=" and ".join(
+            f"{name}.__class__ is int and 0 <= {name} < {size}"
+            for name, size in zip(names, sizes)
+        ),
+        flat=" + ".join(
+            f"{name} * {stride}" if stride != 1 else name
+            for name, stride in zip(names, strides)
+        ),
+    )
+    namespace = {
+        "_getitem": BoardState.__getitem__,
+        "_setitem": BoardState.__setitem__,
+    }
+    exec(source, namespace)
+    name = "BoardState" + "x".join(map(str, sizes))
+    state_cls = _specialized_states[sizes] = type(
+        name,
+        (BoardState,),
+        {
+            "__slots__": (),
+            "__module__": __name__,
+            "__getitem__": namespace["__getitem__"],
+            "__setitem__": namespace["__setitem__"],
+            "__reduce__": _reduce_specialized,
+        },
+    )
+    return state_cls
+
+
+def _reduce_specialized(state: BoardState):
+    # Generated classes are not module attributes, so pickle them by shape
+    return _new_specialized, (state._sizes,), state.__getstate__()
+
+
+def _new_specialized(sizes: tuple[int, ...]) -> BoardState:
+    state_cls = _specialize(sizes)
+    return state_cls.__new__(state_cls)
 
 
 class BoardInsight(Generic[T]):
+    __slots__ = ("state", "resolver", "read_only")
+
     def __init__(
         self,
         *,
@@ -113,6 +275,8 @@ class BoardInsight(Generic[T]):
         self.state[loc] = value
 
 class BoardAxis(Generic[T]):
+    __slots__ = ("state", "path", "dim", "_read_only", "_cells", "_leaf")
+
     def __init__(
         self,
         *,
@@ -121,34 +285,60 @@ class BoardAxis(Generic[T]):
         path: tuple[T, ...],
         dim: Dimension,
     ):
-        self.state = state
-        self.path = path
-        self.dim = dim
-        self.read_only = read_only
+        self.__setstate__((state, tuple(path), dim, read_only))
+
+    def __getstate__(self) -> tuple[BoardState, tuple[T, ...], Dimension, bool]:
+        return self.state, self.path, self.dim, self._read_only
+
+    def __setstate__(
+        self,
+        state: tuple[BoardState, tuple[T, ...], Dimension, bool],
+    ) -> None:
+        # The view must come from the (possibly copied) state's own grid
+        self.state, self.path, self.dim, self._read_only = state
+        self._cells = self.state._grid[self.path]
+        self._leaf = self._cells.ndim == 1
+
+    @property
+    def read_only(self) -> bool:
+        # Boards share axes between lookups, so the flag cannot be changed
+        return self._read_only
 
     @property
     def size(self) -> T:
         return self.dim.size
 
     def _resolve_index(self, key: T) -> int:
-        idx = key
-        if isinstance(key, str):
-            idx = self.dim.get_axis_index(key)
-        return idx
+        return int(self.dim.get_axis_index(key))
 
     def __getitem__(self, key: T) -> T:
-        idx = self._resolve_index(key)
+        # Search code walks axes with plain ints, skip name resolution for it
+        idx = key if key.__class__ is int else self._resolve_index(key)
+        if self._leaf:
+            # The path is validated already, the view checks the last index
+            return self._cells[idx]
         if idx < 0:
             idx += self.size
-        return self.state[(*self.path, idx)]
+        return self.state[self.path + (idx,)]
 
     def __setitem__(self, key: T, value: T):
-        if self.read_only:
+        if self._read_only:
             raise TypeError("Cannot set a readonly insight")
-        idx = self._resolve_index(key)
+        idx = key if key.__class__ is int else self._resolve_index(key)
+        if self._leaf:
+            self._cells[idx] = value
+            return
         if idx < 0:
             idx += self.size
-        self.state[(*self.path, idx)] = value
+        self.state[self.path + (idx,)] = value
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[T | BoardAxis[T]]:
+        if self._leaf:
+            return iter(self._cells)
+        return (self[idx] for idx in range(self.size))
 
     def __repr__(self):
         path = self.path
@@ -171,7 +361,8 @@ class Board(Generic[T]):
                 else Dimension.with_size(dim_or_size)
                 for dim_or_size in dims
             )
-        self.state = BoardState[T](dims)
+        # Plain int keys skip validation on boards of a known geometry
+        self.state = _specialize(tuple(dim.size for dim in dims))(dims)
 
     @property
     def dimensions(self) -> tuple[Dimension, ...]:
@@ -181,11 +372,17 @@ class Board(Generic[T]):
     def dims(self) -> tuple[Dimension, ...]:
         return self.state.dims
 
+    def as_array(self) -> np.ndarray:
+        return self.state.as_array()
+
     def __getitem__(self, key):
         return self.state[key]
 
     def __setitem__(self, key, value):
         self.state[key] = value
 
+    def bulk_set(self, prefix: T | tuple[T, ...], values: Sequence) -> None:
+        self.state.bulk_set(prefix, values)
+
     def __str__(self):
         return str(self.state)
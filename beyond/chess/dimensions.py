@@ -2,6 +2,8 @@ from beyond.dimension import Dimension
 
 
 class ChessDimension(Dimension):
+    __slots__ = ()
+
     default_size = 8
 
     @classmethod
@@ -13,20 +15,52 @@ class ChessDimension(Dimension):
 
 
 class ChessRanks(ChessDimension):
+    __slots__ = ()
+
     default_name = "ranks"
+    _RANK_NAMES = [str(idx) for idx in range(ChessDimension.default_size)]
+    _RANK_TO_IDX = {rank: idx for idx, rank in enumerate(_RANK_NAMES)}
+
+    def setup(self):
+        if (
+            self.size == len(self._RANK_NAMES)
+            and type(self).create_axis_name is ChessRanks.create_axis_name
+        ):
+            self._axis_names = self._RANK_NAMES
+            self._name_to_index = self._RANK_TO_IDX
+        else:
+            super().setup()
 
     def create_axis_name(self, idx: int) -> str:
         return str(idx)
 
 
 class ChessFiles(ChessDimension):
+    __slots__ = ()
+
     default_name = "files"
     files = "abcdefgh"
+    _FILE_NAMES = list(files)
+    # Upper-case aliases spare a casefold() on every lookup
+    _FILE_TO_IDX = {
+        **{file: idx for idx, file in enumerate(files)},
+        **{file: idx for idx, file in enumerate(files.upper())},
+    }
+
+    def setup(self):
+        # The shared tables only describe the stock "abcdefgh" naming
+        if (
+            self.size == len(self._FILE_NAMES)
+            and type(self).files is ChessFiles.files
+            and type(self).create_axis_name is ChessFiles.create_axis_name
+        ):
+            self._axis_names = self._FILE_NAMES
+            self._name_to_index = self._FILE_TO_IDX
+        else:
+            super().setup()
+            name_to_index = self._name_to_index
+            for idx, file in enumerate(self._axis_names):
+                name_to_index.setdefault(file.upper(), idx)
 
     def create_axis_name(self, idx: int) -> str:
         return self.files[idx]
-
-    def get_axis_index(self, name: str | int) -> int:
-        if isinstance(name, str):
-            name = name.casefold()
-        return super().get_axis_index(name)
@@ -1,9 +1,14 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import ClassVar
 
 
 class Dimension:
+    __slots__ = ("name", "size", "_axis_names", "_name_to_index")
+
     default_name: ClassVar[str]
     default_size: ClassVar[int | None] = None
+    _with_size_cache: ClassVar[dict[tuple[type, int], "Dimension"]] = {}
 
     def __init__(
         self,
@@ -21,29 +26,43 @@ class Dimension:
         if size is None:
             raise ValueError("Size must be specified")
         self.size = size
-        self.index: dict[str, int] = {}
+        self._axis_names: list[str] = []
+        self._name_to_index: dict[str, int] = {}
         self.setup()
 
     def setup(self):
+        axis_names = self._axis_names
+        name_to_index = self._name_to_index
         for idx in range(self.size):
-            self.get_axis_name(idx)
+            name = self.create_axis_name(idx)
+            axis_names.append(name)
+            name_to_index.setdefault(name, idx)
+
+    @property
+    def index(self) -> Mapping[str, int]:
+        # The lookup table may also hold aliases (e.g. upper-case chess files)
+        name_to_index = self._name_to_index
+        return MappingProxyType(
+            {name: name_to_index[name] for name in self._axis_names}
+        )
 
     @classmethod
     def default_shape(cls, *, default_size: int | None = None) -> tuple["Dimension", ...]:
         return cls("rows", default_size), cls("columns", default_size)
 
     def get_axis_name(self, idx: int) -> str:
-        name = self.create_axis_name(idx)
-        self.index.setdefault(name, idx)
-        return name
+        return self._axis_names[idx]
 
     def get_axis_index(self, name: str | int) -> int:
-        if isinstance(name, int):
+        if name.__class__ is int:
             # This is not a name, but the desired index
             return name
         try:
-            return self.index[name]
+            return self._name_to_index[name]
         except KeyError:
+            if isinstance(name, int):
+                # An int subclass, e.g. a bool
+                return name
             raise ValueError(f"Unknown name in {self.name}: {name!r}")
 
     def create_axis_name(self, size: int) -> str:
@@ -51,7 +70,11 @@ class Dimension:
 
     @classmethod
     def with_size(cls, size: int):
-        return cls("dim", size)
+        key = (cls, size)
+        dim = cls._with_size_cache.get(key)
+        if dim is None:
+            dim = cls._with_size_cache[key] = cls("dim", size)
+        return dim
 
     def __repr__(self):
         return f"{type(self).__name__}(name={self.name!r}, size={self.size!r})"
@@ -9,8 +9,12 @@ def square_shape(size: int) -> tuple[Dimension, ...]:
 
 
 class Rows(Dimension):
+    __slots__ = ()
+
     default_name = "rows"
 
 
 class Columns(Dimension):
+    __slots__ = ()
+
     default_name = "columns"
@@ -0,0 +1,41 @@
+import numpy as np
+
+
+def line_coords(
+    start: tuple[int, ...],
+    step: tuple[int, ...],
+    length: int,
+) -> tuple[np.ndarray, ...]:
+    coords = (
+        np.asarray(start)[:, np.newaxis]
+        + np.asarray(step)[:, np.newaxis] * np.arange(length)
+    )
+    return tuple(coords)
+
+
+def scan_line(
+    arr: np.ndarray,
+    start: tuple[int, ...],
+    step: tuple[int, ...],
+    length: int,
+) -> np.ndarray:
+    coords = line_coords(start, step, length)
+    if length > 0:
+        # NumPy would wrap negative coordinates around to the far edge
+        for axis, (axis_coords, size) in enumerate(zip(coords, arr.shape)):
+            if axis_coords.min() < 0 or axis_coords.max() >= size:
+                raise IndexError(
+                    f"line from {start} with step {step} and length {length} "
+                    f"leaves the board along axis {axis} of size {size}"
+                )
+    return arr[coords]
+
+
+def count_in_line(
+    arr: np.ndarray,
+    start: tuple[int, ...],
+    step: tuple[int, ...],
+    length: int,
+    value: object,
+) -> int:
+    return int(np.count_nonzero(scan_line(arr, start, step, length) == value))
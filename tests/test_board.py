@@ -0,0 +1,157 @@
+import copy
+import pickle
+
+import pytest
+
+from beyond.board import Board, BoardState, _specialize
+from beyond.chess import ChessBoard, ChessDimension
+from beyond.tictactoe.board import TicTacToeBoard
+
+
+def test_deepcopy_keeps_cells_and_grid_linked():
+    board = TicTacToeBoard()
+    board[0, 0] = "X"
+    board[0]
+    clone = copy.deepcopy(board)
+    clone[1, 1] = "O"
+    clone[2] = 7
+    assert clone.as_array().tolist() == [
+        ["X", None, None],
+        [None, "O", None],
+        [7, 7, 7],
+    ]
+    assert board[1, 1] is None
+    assert board[2, 0] is None
+
+
+def test_deepcopy_rebinds_axis_views():
+    board = TicTacToeBoard()
+    row = board[1]
+    clone = copy.deepcopy(board)
+    clone[1][1] = "O"
+    assert clone[1, 1] == "O"
+    assert clone[1][1] == "O"
+    assert row[1] is None
+
+    row_clone = copy.deepcopy(row)
+    row_clone[2] = "X"
+    assert row_clone.state[1, 2] == "X"
+    assert board[1, 2] is None
+
+
+def test_pickle_specialized_state():
+    board = ChessBoard()
+    board["e", 4] = "P"
+    clone = pickle.loads(pickle.dumps(board))
+    assert type(clone.state) is type(board.state)
+    assert clone["e", 4] == "P"
+    clone[0, 0] = "R"
+    assert clone["a"][0] == "R"
+    assert board[0, 0] is None
+
+
+SPECIALIZED_KEYS = [
+    (0, 0),
+    (7, 7),
+    (3, 5),
+    (-1, 0),
+    (2, -8),
+    (True, 1),
+    (False, True),
+    ("a", 0),
+    ("H", "7"),
+    (4, "3"),
+]
+
+
+def make_chess_states():
+    dims = ChessDimension.default_shape()
+    fast = _specialize(tuple(dim.size for dim in dims))(dims)
+    assert type(fast) is not BoardState
+    return fast, BoardState(dims)
+
+
+@pytest.mark.parametrize("key", SPECIALIZED_KEYS)
+def test_specialized_matches_generic(key):
+    fast, generic = make_chess_states()
+    fast[key] = "x"
+    generic[key] = "x"
+    assert fast[key] == generic[key] == "x"
+    assert fast.as_array().tolist() == generic.as_array().tolist()
+
+
+@pytest.mark.parametrize("key", [(8, 0), (0, 8), (-9, 0), (0, 0, 0)])
+@pytest.mark.parametrize("specialized", [True, False])
+def test_specialized_rejects_out_of_bounds_like_generic(key, specialized):
+    fast, generic = make_chess_states()
+    state = fast if specialized else generic
+    with pytest.raises(IndexError):
+        state[key]
+    with pytest.raises(IndexError):
+        state[key] = "x"
+
+
+def test_cached_axis_read_only_flag_is_immutable():
+    board = TicTacToeBoard()
+    assert board[0] is board[0]
+    with pytest.raises(AttributeError):
+        board[0].read_only = True
+    board[0][1] = "X"
+    assert board[0, 1] == "X"
+
+
+def test_bool_key_broadcast_writes_the_matching_row():
+    board = TicTacToeBoard()
+    board[True] = 5
+    assert board.as_array().tolist() == [
+        [None, None, None],
+        [5, 5, 5],
+        [None, None, None],
+    ]
+    board.bulk_set(False, 6)
+    assert board.as_array().tolist()[0] == [6, 6, 6]
+
+
+def test_bool_key_shares_the_cached_int_axis():
+    board = TicTacToeBoard()
+    axis = board[True]
+    assert axis is board[1]
+    assert axis.path == (1,)
+    assert axis._leaf
+
+
+def test_bulk_set_last_axis_row():
+    board = ChessBoard()
+    board.bulk_set("b", ["P"] * 8)
+    assert list(board["b"]) == ["P"] * 8
+    assert board["a", 0] is None
+
+
+def test_bulk_set_nested_sub_board():
+    board = Board(2, 2, 3)
+    board.bulk_set((), [[1, [1, 2, 3]], 5])
+    assert board.as_array().tolist() == [
+        [[1, 1, 1], [1, 2, 3]],
+        [[5, 5, 5], [5, 5, 5]],
+    ]
+
+
+def test_bulk_set_scalar_fills_sub_board():
+    board = Board(2, 2, 3)
+    board.bulk_set(1, 9)
+    assert board.as_array().tolist() == [
+        [[None] * 3, [None] * 3],
+        [[9] * 3, [9] * 3],
+    ]
+
+
+def test_bulk_set_rejects_wrong_length():
+    board = TicTacToeBoard()
+    with pytest.raises(ValueError):
+        board.bulk_set(0, [1, 2])
+
+
+def test_bulk_set_rejects_full_key():
+    board = TicTacToeBoard()
+    with pytest.raises(IndexError):
+        board.bulk_set((0, 0), [1])
@@ -0,0 +1,36 @@
+from beyond.chess import ChessFiles, ChessRanks
+
+
+def test_files_resolve_both_cases():
+    files = ChessFiles()
+    assert files.get_axis_index("c") == files.get_axis_index("C") == 2
+    assert files.get_axis_name(7) == "h"
+
+
+def test_subclass_files_are_not_shadowed_by_shared_table():
+    class MyFiles(ChessFiles):
+        __slots__ = ()
+
+        files = "ijklmnop"
+
+    files = MyFiles()
+    assert files.get_axis_index("i") == 0
+    assert files.get_axis_index("P") == 7
+    assert files.get_axis_name(0) == "i"
+
+
+def test_subclass_rank_names_are_not_shadowed_by_shared_table():
+    class OneBasedRanks(ChessRanks):
+        __slots__ = ()
+
+        def create_axis_name(self, idx: int) -> str:
+            return str(idx + 1)
+
+    ranks = OneBasedRanks()
+    assert ranks.get_axis_index("1") == 0
+    assert ranks.get_axis_name(7) == "8"
+
+
+def test_index_lists_only_axis_names():
+    assert dict(ChessFiles().index) == {file: idx for idx, file in enumerate("abcdefgh")}
+    assert dict(ChessFiles(size=3).index) == {"a": 0, "b": 1, "c": 2}
@@ -0,0 +1,27 @@
+import pytest
+
+from beyond.scan import count_in_line, scan_line
+from beyond.tictactoe.board import TicTacToeBoard
+
+
+def make_board():
+    board = TicTacToeBoard()
+    board[0, 0] = board[1, 1] = board[2, 2] = "X"
+    board[0, 2] = "O"
+    return board.as_array()
+
+
+def test_scan_line_diagonals():
+    arr = make_board()
+    assert scan_line(arr, (0, 0), (1, 1), 3).tolist() == ["X", "X", "X"]
+    assert count_in_line(arr, (0, 2), (1, -1), 3, "X") == 1
+
+
+@pytest.mark.parametrize(
+    ("start", "step"),
+    [((0, 0), (-1, -1)), ((1, 1), (1, 1)), ((0, 0), (0, 3))],
+)
+def test_scan_line_rejects_lines_leaving_the_board(start, step):
+    arr = make_board()
+    with pytest.raises(IndexError):
+        count_in_line(arr, start, step, 3, "X")